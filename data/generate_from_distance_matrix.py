@@ -15,12 +15,26 @@
 - 输入：距离矩阵（而非节点坐标）
 - 跳过距离计算步骤
 - 保持相同的时间缩放和周期分配逻辑
+
+可选依赖：
+- numba：节点数超过 NUMBA_THRESHOLD 时使用编译后的并行内核进行时间缩放和周期分配，
+  未安装时自动使用 NumPy 实现，结果一致
 """
 
-import random
-import math
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import numpy as np
+import contextlib
+import functools
+import warnings
+import io
 import os
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 # ==================== 常量定义 ====================
 # 表示无限大的距离值，对应距离矩阵中的对角线元素
 INFINITY_DISTANCE = 10000000
@@ -31,6 +45,12 @@ INFINITY_PERIOD = 100000
 # 距离矩阵中对角线的标识值（来自苏州姑苏区数据）
 DIAGONAL_MARKER = 1111112
 
+# 节点数超过该值且已安装 numba 时，使用编译内核代替 NumPy 实现
+NUMBA_THRESHOLD = 2000
+
+# 批量生成时，节点数超过该值才使用多进程并行，否则进程池启动开销大于收益
+PARALLEL_THRESHOLD = 200
+
 
 # ==================== 路径配置 ====================
 # 获取脚本所在目录的绝对路径
@@ -40,6 +60,35 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_OUTPUT_DIR = os.path.join(SCRIPT_DIR, 'input')
 
 
+# ==================== Numba 内核（可选） ====================
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _scale_times_numba(distance_matrix, multiplier):
+        """按行并行地将距离矩阵缩放为时间矩阵，对角线设为 INFINITY_DISTANCE"""
+        node_num = distance_matrix.shape[0]
+        time_matrix = np.empty((node_num, node_num), dtype=np.int32)
+        for i in prange(node_num):
+            for j in range(node_num):
+                distance = distance_matrix[i, j]
+                if i == j or distance == DIAGONAL_MARKER:
+                    time_matrix[i, j] = INFINITY_DISTANCE
+                else:
+                    time_matrix[i, j] = np.int32(np.ceil(distance * multiplier))
+        return time_matrix
+
+    @njit(parallel=True, cache=True)
+    def _assign_periods_numba(time_to_depot, periods, random_values):
+        """按行并行地在有序周期中二分查找可选范围，并选取第 floor(random_value * 可选数) 个"""
+        node_num = time_to_depot.shape[0]
+        assigned = np.empty(node_num, dtype=np.int32)
+        for i in prange(node_num):
+            first_valid = np.searchsorted(periods, time_to_depot[i], side='right')
+            valid_count = periods.shape[0] - first_valid
+            selected = first_valid + np.int64(random_values[i] * valid_count)
+            assigned[i] = periods[min(selected, periods.shape[0] - 1)]
+        return assigned
+
+
 def read_distance_matrix(file_path):
     """
     从文件中读取距离矩阵
@@ -51,7 +100,7 @@ def read_distance_matrix(file_path):
         file_path (str): 距离矩阵文件路径
     
     Returns:
-        list: 二维距离矩阵 distance_matrix[i][j] 表示节点 i 到节点 j 的距离
+        np.ndarray: 二维距离矩阵 distance_matrix[i][j] 表示节点 i 到节点 j 的距离
             - 对角线元素为 DIAGONAL_MARKER（将在后续处理中转为 INFINITY_DISTANCE）
             - 索引从 0 开始（文件中的节点1对应索引0）
     
@@ -69,114 +118,119 @@ def read_distance_matrix(file_path):
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"距离矩阵文件不存在: {file_path}")
     
-    distance_matrix = []
-    
     with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-        
-        if len(lines) < 2:
+        # 跳过第一行表头（id 1 2 3 ...）
+        if not f.readline():
             raise ValueError("距离矩阵文件格式错误：至少需要表头和一行数据")
         
-        # 跳过第一行表头（id 1 2 3 ...）
-        for i, line in enumerate(lines[1:], start=1):
-            line = line.strip()
-            
-            # 跳过空行
-            if not line:
-                continue
-            
-            # 解析距离数据（制表符分隔）
-            parts = line.split('\t')
-            
-            # 第一列是节点ID，后续列是距离值
-            if len(parts) < 2:
-                continue  # 跳过格式不正确的行
-            
-            # 提取距离值（跳过第一列的节点ID）
-            try:
-                distances = [int(d) for d in parts[1:] if d.strip()]
-                distance_matrix.append(distances)
-            except ValueError as e:
-                raise ValueError(f"第 {i+1} 行数据格式错误: {e}")
+        # 去除行首尾空白（包括行尾多余的制表符），跳过空行和不含距离值的行
+        rows = (line.strip() for line in f)
+        rows = (line for line in rows if '\t' in line)
+        
+        # 解析制表符分隔的距离数据
+        try:
+            with warnings.catch_warnings():
+                # 没有数据行时由下方给出更明确的错误信息
+                warnings.simplefilter('ignore', UserWarning)
+                distance_matrix = np.loadtxt(rows, delimiter='\t', dtype=np.int32, ndmin=2)
+        except ValueError as e:
+            raise ValueError(f"距离矩阵文件格式错误: {e}")
     
-    # 验证矩阵是方阵
-    n = len(distance_matrix)
-    if n == 0:
-        raise ValueError("距离矩阵为空")
+    if distance_matrix.size == 0:
+        raise ValueError("距离矩阵为空：文件中没有包含距离值的数据行")
+    
+    # 第一列是节点ID，后续列是距离值
+    distance_matrix = distance_matrix[:, 1:]
     
-    for i, row in enumerate(distance_matrix):
-        if len(row) != n:
-            raise ValueError(f"距离矩阵不是方阵：第 {i+1} 行有 {len(row)} 列，期望 {n} 列")
+    # 验证矩阵是方阵
+    n, m = distance_matrix.shape
+    if n != m:
+        raise ValueError(f"距离矩阵不是方阵：共 {n} 行，每行 {m} 列，期望 {n} 列")
     
     print(f"✓ 成功读取距离矩阵: {n} × {n}")
     
     return distance_matrix
 
 
-def generate_case_from_distance_matrix(
+def assign_periods(time_to_depot, valid_period_list, rng=None):
+    """
+    为各节点随机分配监控周期
+    
+    对每个节点，在 valid_period_list 中所有大于其到起点时间的周期里等概率随机选择一个；
+    若没有满足条件的周期，则使用最大的可用周期。周期排序后通过二分查找一次性确定
+    所有节点的可选范围，无需为每个节点构建候选列表。
+    
+    Args:
+        time_to_depot (np.ndarray): 各节点到起点的时间，形状为 (node_num,)
+        valid_period_list (list): 有效的监控周期选项
+        rng (np.random.Generator): 随机数生成器，默认新建一个
+    
+    Returns:
+        np.ndarray: 各节点分配到的监控周期，形状为 (node_num,)
+    
+    Example:
+        >>> periods = assign_periods(np.array([0, 2, 5]), [3, 6, 12])
+        >>> periods[2] in (6, 12)  # 到起点时间为5，只能选择大于5的周期
+        True
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    # 周期排序后，大于到起点时间的周期为一段连续后缀，用二分查找定位其起点
+    periods = np.sort(np.asarray(valid_period_list, dtype=np.int32))
+    time_to_depot = np.asarray(time_to_depot)
+    
+    random_values = rng.random(len(time_to_depot))
+    
+    if njit is not None and len(time_to_depot) > NUMBA_THRESHOLD:
+        return _assign_periods_numba(time_to_depot.astype(np.int32), periods, random_values)
+    
+    # 筛选满足条件的周期：周期 > 到起点的时间
+    # 这确保无人机有足够时间飞到目标点并返回
+    first_valid = np.searchsorted(periods, time_to_depot, side='right')
+    valid_count = len(periods) - first_valid
+    
+    # 在满足条件的周期中等概率选取一个
+    selected = first_valid + (random_values * valid_count).astype(np.intp)
+    
+    # 如果没有满足条件的周期，使用最大的可用周期
+    return periods[np.minimum(selected, len(periods) - 1)]
+
+
+def load_and_scale(
     distance_matrix_path,
-    output_dir,
-    instance_name='SZ_Gusu',
-    version='1p',
     base_time_horizon=108,
     base_drone_time=90,
-    time_num=12,
-    drone_num=30,
-    period_list=[3, 6, 12, 18, 24]
+    time_num=12
 ):
     """
-    基于距离矩阵生成无人机监控实例
+    读取距离矩阵并缩放为时间矩阵
     
-    从距离矩阵文件读取节点间距离，应用时间缩放逻辑，为每个目标点分配监控周期，
-    并生成格式化的实例文件。缩放逻辑与 generate_period_v2 保持一致。
-    
-    主要步骤：
-    1. 读取距离矩阵文件
-    2. 计算时间缩放因子 (multiplier = time_num / base_time_horizon)
-    3. 将距离缩放为时间 (travel_time = ceil(distance * multiplier))
-    4. 为每个目标点随机分配监控周期（需满足周期 > 到起点的时间）
-    5. 生成格式化的实例文件
+    时间矩阵只取决于距离矩阵和缩放因子，与随机分配的监控周期无关，
+    批量生成多个版本时只需调用一次，再将结果传给 emit_instance()。
     
     Args:
         distance_matrix_path (str): 距离矩阵文件路径
-        output_dir (str): 输出目录路径
-        instance_name (str): 实例标识名称，默认 'SZ_Gusu'
-        version (str): 版本号，用于区分不同的随机实例，默认 '1p'
         base_time_horizon (int): 基准时间窗口（距离矩阵对应的原始时间尺度），默认 108
         base_drone_time (int): 基准无人机续航时间（原始时间尺度下），默认 90
         time_num (int): 目标规划时间范围（缩放后），默认 12
-        drone_num (int): 可用无人机数量，默认 30
-        period_list (list): 可选的监控周期列表，默认 [3, 6, 12, 18, 24]
     
     Returns:
-        str: 生成的实例文件名（不含路径）
-    
-    输出文件格式：
-        第1行: 列标题（numNode, numCus, ID_Depot, Mile(min), Begin, End, numUAV）
-        第2行: 基本参数值
-        第3行: 数据标题（time_vec & deta1 & deta2:）
-        后续行: 每个节点的数据（节点ID + 到各节点的时间 + 监控开始时间 + 监控周期）
+        tuple: (time_matrix, scaled_drone_time, scaled_time_horizon)
+            - time_matrix (np.ndarray): 节点间飞行时间矩阵，对角线为 INFINITY_DISTANCE
+            - scaled_drone_time (int): 缩放后的无人机续航时间
+            - scaled_time_horizon (int): 缩放后的规划结束时间
     
     Example:
-        >>> instance = generate_case_from_distance_matrix(
-        ...     'solomon/distance_matrix_suzhou_gusu.txt',
-        ...     'input',
-        ...     instance_name='SZ_Gusu',
-        ...     version='1p',
-        ...     time_num=12,
-        ...     drone_num=30
+        >>> time_matrix, drone_time, horizon = load_and_scale(
+        ...     'solomon/distance_matrix_suzhou_gusu_10.txt',
+        ...     base_time_horizon=21600, base_drone_time=18000, time_num=12
         ... )
-        >>> print(instance)
-        SZ_GusuN19D30T12V1p
-    
-    Notes:
-        - 节点0默认为起点（仓库），监控周期设置为无限大
-        - 距离矩阵对角线值 DIAGONAL_MARKER 会被转换为 INFINITY_DISTANCE
-        - 时间缩放逻辑与 Solomon 数据集处理方式一致
-        - 监控周期必须大于从起点到该节点的飞行时间
+        >>> time_matrix.shape
+        (11, 11)
     """
     print("\n" + "=" * 60)
-    print("开始生成实例...")
+    print("加载距离矩阵...")
     print("=" * 60)
     
     # ========== 1. 读取距离矩阵 ==========
@@ -205,6 +259,97 @@ def generate_case_from_distance_matrix(
     # ========== 3. 距离转换为时间 ==========
     print(f"\n[步骤 3/6] 转换距离为时间")
     
+    if njit is not None and node_num > NUMBA_THRESHOLD:
+        time_matrix = _scale_times_numba(distance_matrix, multiplier)
+    else:
+        # 对角线（自身到自身）及 DIAGONAL_MARKER 位置
+        diagonal_mask = distance_matrix == DIAGONAL_MARKER
+        np.fill_diagonal(diagonal_mask, True)
+        
+        # 距离 * 缩放因子 = 时间（向上取整），对角线位置设为 INFINITY_DISTANCE
+        time_matrix = np.where(diagonal_mask, INFINITY_DISTANCE,
+                               np.ceil(distance_matrix * multiplier).astype(np.int32))
+    
+    print(f"  - 时间矩阵: {node_num} × {node_num}")
+    
+    return time_matrix, scaled_drone_time, scaled_time_horizon
+
+
+def build_node_table(time_matrix):
+    """
+    构建节点数据表中与监控周期无关的部分
+    
+    节点ID、到各节点的时间和监控开始时间在各版本间保持不变，只需填充一次；
+    最后一列（监控周期）由 emit_instance() 在每个版本中原地写入。
+    
+    Args:
+        time_matrix (np.ndarray): load_and_scale() 返回的节点间飞行时间矩阵
+    
+    Returns:
+        np.ndarray: 节点数据表，形状为 (node_num, node_num + 3)，
+            每行为 节点ID + 到各节点的时间 + 监控开始时间（固定为0） + 监控周期（待填充）
+    """
+    node_num = len(time_matrix)
+    node_data = np.empty((node_num, node_num + 3), dtype=np.int32)
+    node_data[:, 0] = np.arange(node_num)
+    node_data[:, 1:node_num + 1] = time_matrix
+    node_data[:, node_num + 1] = 0
+    
+    return node_data
+
+
+def emit_instance(
+    time_matrix,
+    output_dir,
+    scaled_drone_time,
+    scaled_time_horizon,
+    instance_name='SZ_Gusu',
+    version='1p',
+    time_num=12,
+    drone_num=30,
+    period_list=[3, 6, 12, 18, 24],
+    seed=None,
+    node_data=None,
+    buf=None
+):
+    """
+    基于已缩放的时间矩阵生成单个版本的实例文件
+    
+    只负责随机分配监控周期和写入文件，时间矩阵由 load_and_scale() 预先计算。
+    批量生成时可传入 build_node_table() 预先构建的 node_data 和预分配的 buf，
+    各版本只重新写入监控周期列，避免重复复制时间矩阵和分配内存。
+    
+    Args:
+        time_matrix (np.ndarray): load_and_scale() 返回的节点间飞行时间矩阵
+        output_dir (str): 输出目录路径
+        scaled_drone_time (int): 缩放后的无人机续航时间，由 load_and_scale() 返回
+        scaled_time_horizon (int): 缩放后的规划结束时间，由 load_and_scale() 返回
+        instance_name (str): 实例标识名称，默认 'SZ_Gusu'
+        version (str): 版本号，用于区分不同的随机实例，默认 '1p'
+        time_num (int): 目标规划时间范围（缩放后），默认 12
+        drone_num (int): 可用无人机数量，默认 30
+        period_list (list): 可选的监控周期列表，默认 [3, 6, 12, 18, 24]
+        seed (int | np.random.Generator): 随机种子或随机数生成器，默认 None（不固定种子）
+            批量生成时可传入同一个 Generator 以复用随机数状态
+        node_data (np.ndarray): build_node_table() 构建的节点数据表，默认 None（新建）
+        buf (io.StringIO): 预分配的文件内容缓冲区，默认 None（新建）
+    
+    Returns:
+        str: 生成的实例文件名（不含路径）
+    
+    Raises:
+        ValueError: 没有不超过 time_num 的监控周期选项
+    """
+    print("\n" + "=" * 60)
+    print(f"开始生成实例 (版本 {version})...")
+    print("=" * 60)
+    
+    node_num = len(time_matrix)
+    target_num = node_num - 1  # 目标数 = 节点数 - 起点
+    
+    # ========== 4. 分配监控周期 ==========
+    print(f"\n[步骤 4/6] 分配监控周期")
+    
     # 过滤出不超过 time_num 的监控周期选项
     valid_period_list = [p for p in period_list if p <= time_num]
     if not valid_period_list:
@@ -213,55 +358,26 @@ def generate_case_from_distance_matrix(
     print(f"  - 原始周期选项: {period_list}")
     print(f"  - 有效周期选项: {valid_period_list}")
     
-    # 构建时间矩阵和节点数据
-    target_data = []
+    # 节点数据表：节点ID + 到各节点的时间 + 监控开始时间（固定为0） + 监控周期
+    if node_data is None:
+        node_data = build_node_table(time_matrix)
     
-    for i in range(node_num):
-        node_row = [i]  # 节点ID
-        
-        # 转换距离为时间
-        for j in range(node_num):
-            distance = distance_matrix[i][j]
-            
-            # 处理对角线（自身到自身）
-            if distance == DIAGONAL_MARKER or i == j:
-                travel_time = INFINITY_DISTANCE
-            else:
-                # 距离 * 缩放因子 = 时间（向上取整）
-                travel_time = math.ceil(distance * multiplier)
-            
-            node_row.append(travel_time)
-        
-        # 添加监控开始时间（固定为0）
-        node_row.append(0)
-        
-        # ========== 4. 分配监控周期 ==========
-        if i == 0:
-            # 起点（仓库）不需要被监控
-            assigned_period = INFINITY_PERIOD
-        else:
-            # 获取从起点到当前节点的时间（索引1对应起点0）
-            time_to_depot = node_row[1]
-            
-            # 筛选满足条件的周期：周期 > 到起点的时间
-            # 这确保无人机有足够时间飞到目标点并返回
-            filtered_periods = [p for p in valid_period_list if p > time_to_depot]
-            
-            if not filtered_periods:
-                # 如果没有满足条件的周期，使用最大的可用周期
-                filtered_periods = [max(valid_period_list)]
-                print(f"  ⚠ 节点 {i}: 到起点时间={time_to_depot}，使用最大周期 {filtered_periods[0]}")
-            
-            # 随机选择一个周期
-            assigned_period = random.choice(filtered_periods)
-        
-        node_row.append(assigned_period)
-        target_data.append(node_row)
+    # 获取从各节点到起点的时间（第0列对应起点0），周期直接写入数据表最后一列
+    rng = np.random.default_rng(seed)
+    assigned_periods = node_data[:, node_num + 2]
+    assigned_periods[:] = assign_periods(time_matrix[:, 0], valid_period_list, rng)
+    
+    # 起点（仓库）不需要被监控
+    assigned_periods[0] = INFINITY_PERIOD
+    
+    # 没有满足条件的周期的节点已使用最大的可用周期
+    for i in np.flatnonzero(time_matrix[1:, 0] >= max(valid_period_list)) + 1:
+        print(f"  ⚠ 节点 {i}: 到起点时间={time_matrix[i, 0]}，使用最大周期 {assigned_periods[i]}")
     
     print(f"  - 已为 {node_num} 个节点分配时间和周期")
     
-    # ========== 5. 准备输出数据 ==========
-    print(f"\n[步骤 4/6] 准备输出数据")
+    # ========== 5. 写入实例文件 ==========
+    print(f"\n[步骤 5/6] 生成实例文件")
     
     # 基本数据：节点数, 目标数, 仓库ID, 无人机续航, 开始时间, 结束时间, 无人机数
     basic_data = [
@@ -276,9 +392,6 @@ def generate_case_from_distance_matrix(
     
     print(f"  - 基本参数: {basic_data}")
     
-    # ========== 6. 写入实例文件 ==========
-    print(f"\n[步骤 5/6] 生成实例文件")
-    
     # 构建实例文件名
     instance_filename = f'{instance_name}N{target_num}D{drone_num}T{time_num}V{version}'
     
@@ -288,42 +401,41 @@ def generate_case_from_distance_matrix(
     # 输出文件路径
     output_file = os.path.join(output_dir, f'{instance_filename}.txt')
     
-    with open(output_file, 'w+', encoding='utf-8') as f:
-        # 写入列标题
-        f.write('numNode\tnumCus\tID_Depot\tMile(min)\tBegin\tEnd\tnumUAV\n')
-        
-        # 写入基本数据行
-        for item in basic_data:
-            f.write(f'{item}\t')
-        f.write('\n')
-        
-        # 写入节点数据标题
-        f.write('time_vec & deta1 & deta2:\n')
-        
-        # 写入每个节点的数据
-        for node_data in target_data:
-            for value in node_data:
-                f.write(f'{value}\t')
-            f.write('\n')
+    # 在内存中拼接完整的文件内容，最后一次性写入
+    if buf is None:
+        buf = io.StringIO()
+    buf.seek(0)
+    buf.truncate()
+    
+    # 写入列标题
+    buf.write('numNode\tnumCus\tID_Depot\tMile(min)\tBegin\tEnd\tnumUAV\n')
+    
+    # 写入基本数据行（每个值后跟制表符，与原有实例文件格式一致）
+    buf.write(('%d\t' * len(basic_data)) % tuple(basic_data) + '\n')
+    
+    # 写入节点数据标题
+    buf.write('time_vec & deta1 & deta2:\n')
+    
+    # 写入每个节点的数据（每个值后跟制表符，与原有实例文件格式一致）
+    # 预先构建整行的格式串，每行只做一次格式化
+    row_fmt = '%d\t' * node_data.shape[1] + '\n'
+    buf.writelines(row_fmt % tuple(row) for row in node_data.tolist())
+    
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(buf.getvalue())
     
     print(f"  - 输出路径: {output_file}")
     print(f"  - 实例名称: {instance_filename}")
     
-    # ========== 7. 生成摘要信息 ==========
+    # ========== 6. 生成摘要信息 ==========
     print(f"\n[步骤 6/6] 生成摘要")
     
-    # 统计周期分布
-    period_distribution = {}
-    for i, node_data in enumerate(target_data):
-        if i == 0:  # 跳过起点
-            continue
-        period = node_data[-1]
-        period_distribution[period] = period_distribution.get(period, 0) + 1
+    # 统计周期分布（跳过起点）
+    period_counts = np.bincount(assigned_periods[1:])
     
     print(f"  - 监控周期分布:")
-    for period in sorted(period_distribution.keys()):
-        count = period_distribution[period]
-        print(f"    * 周期 {period}: {count} 个节点")
+    for period in np.flatnonzero(period_counts):
+        print(f"    * 周期 {period}: {period_counts[period]} 个节点")
     
     print("\n" + "=" * 60)
     print(f"✓ 实例生成完成: {instance_filename}")
@@ -332,6 +444,113 @@ def generate_case_from_distance_matrix(
     return instance_filename
 
 
+def generate_case_from_distance_matrix(
+    distance_matrix_path,
+    output_dir,
+    instance_name='SZ_Gusu',
+    version='1p',
+    base_time_horizon=108,
+    base_drone_time=90,
+    time_num=12,
+    drone_num=30,
+    period_list=[3, 6, 12, 18, 24],
+    seed=None
+):
+    """
+    基于距离矩阵生成无人机监控实例
+    
+    从距离矩阵文件读取节点间距离，应用时间缩放逻辑，为每个目标点分配监控周期，
+    并生成格式化的实例文件。缩放逻辑与 generate_period_v2 保持一致。
+    依次调用 load_and_scale() 和 emit_instance()；批量生成多个版本时应直接
+    调用这两个函数，避免重复读取距离矩阵。
+    
+    主要步骤：
+    1. 读取距离矩阵文件
+    2. 计算时间缩放因子 (multiplier = time_num / base_time_horizon)
+    3. 将距离缩放为时间 (travel_time = ceil(distance * multiplier))
+    4. 为每个目标点随机分配监控周期（需满足周期 > 到起点的时间）
+    5. 生成格式化的实例文件
+    
+    Args:
+        distance_matrix_path (str): 距离矩阵文件路径
+        output_dir (str): 输出目录路径
+        instance_name (str): 实例标识名称，默认 'SZ_Gusu'
+        version (str): 版本号，用于区分不同的随机实例，默认 '1p'
+        base_time_horizon (int): 基准时间窗口（距离矩阵对应的原始时间尺度），默认 108
+        base_drone_time (int): 基准无人机续航时间（原始时间尺度下），默认 90
+        time_num (int): 目标规划时间范围（缩放后），默认 12
+        drone_num (int): 可用无人机数量，默认 30
+        period_list (list): 可选的监控周期列表，默认 [3, 6, 12, 18, 24]
+        seed (int | np.random.Generator): 随机种子或随机数生成器，默认 None（不固定种子）
+    
+    Returns:
+        str: 生成的实例文件名（不含路径）
+    
+    输出文件格式：
+        第1行: 列标题（numNode, numCus, ID_Depot, Mile(min), Begin, End, numUAV）
+        第2行: 基本参数值
+        第3行: 数据标题（time_vec & deta1 & deta2:）
+        后续行: 每个节点的数据（节点ID + 到各节点的时间 + 监控开始时间 + 监控周期）
+    
+    Example:
+        >>> instance = generate_case_from_distance_matrix(
+        ...     'solomon/distance_matrix_suzhou_gusu.txt',
+        ...     'input',
+        ...     instance_name='SZ_Gusu',
+        ...     version='1p',
+        ...     time_num=12,
+        ...     drone_num=30
+        ... )
+        >>> print(instance)
+        SZ_GusuN19D30T12V1p
+    
+    Notes:
+        - 节点0默认为起点（仓库），监控周期设置为无限大
+        - 距离矩阵对角线值 DIAGONAL_MARKER 会被转换为 INFINITY_DISTANCE
+        - 时间缩放逻辑与 Solomon 数据集处理方式一致
+        - 监控周期必须大于从起点到该节点的飞行时间
+    """
+    time_matrix, scaled_drone_time, scaled_time_horizon = load_and_scale(
+        distance_matrix_path,
+        base_time_horizon=base_time_horizon,
+        base_drone_time=base_drone_time,
+        time_num=time_num
+    )
+    
+    return emit_instance(
+        time_matrix,
+        output_dir,
+        instance_name=instance_name,
+        version=version,
+        scaled_drone_time=scaled_drone_time,
+        scaled_time_horizon=scaled_time_horizon,
+        time_num=time_num,
+        drone_num=drone_num,
+        period_list=period_list,
+        seed=seed
+    )
+
+
+# ==================== 并行生成 ====================
+# 每个工作进程持有的时间矩阵、节点数据表和文件缓冲区，由 _init_worker() 初始化
+_worker_state = None
+
+
+def _init_worker(time_matrix):
+    """工作进程初始化：接收一次时间矩阵，构建本进程复用的节点数据表和缓冲区"""
+    global _worker_state
+    _worker_state = (time_matrix, build_node_table(time_matrix), io.StringIO())
+
+
+def _emit_worker(kwargs):
+    """在工作进程中生成单个版本，返回实例名称和该版本的输出日志"""
+    time_matrix, node_data, buf = _worker_state
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        instance = emit_instance(time_matrix, node_data=node_data, buf=buf, **kwargs)
+    return instance, log.getvalue()
+
+
 if __name__ == '__main__':
     """
     主程序：批量生成基于距离矩阵的无人机监控实例
@@ -369,6 +588,12 @@ if __name__ == '__main__':
     # 生成的版本数量
     version_range = range(1, 6)  # 生成版本 1p 到 5p
     
+    # 随机种子（设为整数可复现生成结果，None 表示不固定）
+    seed = None
+    
+    # 并行生成的进程数（None 表示使用全部 CPU 核心）
+    max_workers = None
+    
     # ========== 打印配置信息 ==========
     print("\n" + "=" * 60)
     print("基于距离矩阵的无人机监控实例生成器")
@@ -383,6 +608,7 @@ if __name__ == '__main__':
     print(f"  - 基准无人机续航: {base_drone_time}")
     print(f"  - 输出目录: {output_directory}")
     print(f"  - 生成版本: {list(version_range)}")
+    print(f"  - 随机种子: {seed}")
     print("=" * 60)
     
     # ========== 检查文件是否存在 ==========
@@ -391,30 +617,77 @@ if __name__ == '__main__':
         print("请检查文件路径是否正确")
         exit(1)
     
+    # ========== 读取距离矩阵（所有版本共用） ==========
+    try:
+        time_matrix, scaled_drone_time, scaled_time_horizon = load_and_scale(
+            distance_matrix_file,
+            base_time_horizon=base_time_horizon,
+            base_drone_time=base_drone_time,
+            time_num=time_num
+        )
+    except Exception as e:
+        print(f"\n✗ 读取距离矩阵失败: {str(e)}")
+        exit(1)
+    
     # ========== 批量生成实例 ==========
+    # 各版本相互独立，可分发到多个进程并行生成。时间矩阵通过 initargs 传给每个
+    # 工作进程一次，各进程只构建一次节点数据表，之后每个版本只重新分配监控周期
+    # 每个版本使用由同一种子派生的独立随机数生成器，结果与是否并行及调度顺序无关
+    version_rngs = [np.random.default_rng(s)
+                    for s in np.random.SeedSequence(seed).spawn(len(version_range))]
+    jobs = []
+    for i, version_rng in zip(version_range, version_rngs):
+        version = f'{i}p'
+        jobs.append((version, dict(
+            output_dir=output_directory,
+            instance_name=instance_name,
+            version=version,
+            scaled_drone_time=scaled_drone_time,
+            scaled_time_horizon=scaled_time_horizon,
+            time_num=time_num,
+            drone_num=drone_num,
+            period_list=period_list,
+            seed=version_rng
+        )))
+    
+    # 只有一个版本、矩阵较小或只有一个可用进程时直接在当前进程中串行生成
+    worker_num = min(max_workers or os.cpu_count() or 1, len(jobs))
+    use_pool = worker_num > 1 and len(time_matrix) > PARALLEL_THRESHOLD
+    if use_pool:
+        print(f"\n并行生成 {len(jobs)} 个版本（进程数: {worker_num}）")
+    else:
+        print(f"\n串行生成 {len(jobs)} 个版本")
+    
     generated_instances = []
     
-    for i in version_range:
-        version = f'{i}p'
+    with contextlib.ExitStack() as stack:
+        if use_pool:
+            # 使用 spawn 启动工作进程：父进程可能已运行过 numba 并行内核，
+            # fork 出的子进程继承其线程池状态后会崩溃，或导致主进程无法退出
+            executor = stack.enter_context(ProcessPoolExecutor(
+                max_workers=worker_num,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(time_matrix,)
+            ))
+            results = [(version, executor.submit(_emit_worker, kwargs).result)
+                       for version, kwargs in jobs]
+        else:
+            _init_worker(time_matrix)
+            results = [(version, functools.partial(_emit_worker, kwargs))
+                       for version, kwargs in jobs]
         
-        try:
-            instance = generate_case_from_distance_matrix(
-                distance_matrix_path=distance_matrix_file,
-                output_dir=output_directory,
-                instance_name=instance_name,
-                version=version,
-                base_time_horizon=base_time_horizon,
-                base_drone_time=base_drone_time,
-                time_num=time_num,
-                drone_num=drone_num,
-                period_list=period_list
-            )
-            generated_instances.append(instance)
-            
-        except Exception as e:
-            print(f"\n✗ 生成失败 (版本 {version}): {str(e)}")
-            import traceback
-            traceback.print_exc()
+        # 按版本顺序输出各版本的日志
+        for version, get_result in results:
+            try:
+                instance, log = get_result()
+                print(log, end='')
+                generated_instances.append(instance)
+                
+            except Exception as e:
+                print(f"\n✗ 生成失败 (版本 {version}): {str(e)}")
+                import traceback
+                traceback.print_exc()
     
     # ========== 生成完成摘要 ==========
     print("\n" + "=" * 60)
@@ -18,10 +18,12 @@
 import pandas as pd
 import numpy as np
 import warnings
-import random
-import math
+import io
 import os
 
+# 监控周期的随机分配逻辑与基于距离矩阵的生成器共用同一实现
+from generate_from_distance_matrix import assign_periods
+
 warnings.filterwarnings('ignore')
 
 # ==================== 常量定义 ====================
@@ -41,65 +43,6 @@ SOLOMON_DIR = os.path.join(SCRIPT_DIR, 'solomon')
 # 生成的实例文件输出目录（默认）
 OUTPUT_DIR = os.path.join(SCRIPT_DIR, 'input')
 
-def generate_period_v1(data_path, ins_type, version, drone_num = 30, period_list = [1,6,12]):
-    """
-    生成周期性监控实例 - 版本1 (已废弃)
-    
-    警告：此函数已废弃，请使用 generate_period_v2() 代替。
-    该版本存在路径硬编码、功能受限等问题，仅保留用于向后兼容。
-    
-    Args:
-        data_path (str): 输入数据文件路径
-        ins_type (str): 实例类型标识（如 'C1', 'R1', 'RC1'）
-        version (str): 版本号标识
-        drone_num (int): 无人机数量，默认 30
-        period_list (list): 可选的监控周期列表，默认 [1,6,12]
-    
-    Returns:
-        str: 生成的实例名称
-        
-    Deprecated:
-        已废弃
-    """
-    # 发出废弃警告
-    warnings.warn(
-        "generate_period_v1 已废弃，请使用 generate_period_v2 代替",
-        DeprecationWarning,
-        stacklevel=2
-    )
-    
-    f = open(data_path)
-    txt = []
-    for line in f:
-        txt.append(line.strip())
-
-    data_list = []
-    for i in range(len(txt)):
-        if i == 1:
-            ans = [int(j) for j in txt[i].split('\t')]
-            target_num = ans[1]
-            ans[-1] = drone_num
-        elif i in [0, 2, 3]:
-            ans = [j for j in txt[i].split('\t')]
-        else:
-            ans = [int(j) for j in txt[i].split('\t')]
-            ans[-1] = random.choice(period_list)
-        data_list.append(ans)   
-    
-    instance_name = f'{ins_type}N{target_num}D{drone_num}V{version}'
-    
-    # 注意：此处路径硬编码是该版本的主要问题之一
-    output_path = f'dataset_distance/{ins_type}/instance/{ins_type}N{target_num}D{drone_num}V{version}.txt'
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    
-    with open(output_path, 'w+') as f:
-        for i in data_list:
-            for j in i:
-                f.write(f'{j}\t')
-            f.write('\n')
-    
-    return instance_name
-
 def cal_distance(position_data):
     """
     计算节点间的欧几里得距离矩阵
@@ -108,11 +51,11 @@ def cal_distance(position_data):
     对角线元素（节点到自身的距离）设置为无限大值。
     
     Args:
-        position_data (list): 节点位置列表，每个元素为 [x, y] 坐标
+        position_data (list | np.ndarray): 节点位置列表，每个元素为 [x, y] 坐标
             例如: [[0, 0], [1, 2], [3, 4]]
     
     Returns:
-        list: 二维距离矩阵，distance_vec[i][j] 表示节点 i 到节点 j 的距离
+        np.ndarray: 二维距离矩阵，distance_vec[i][j] 表示节点 i 到节点 j 的距离
             - 对角线元素（i==j）为 INFINITY_DISTANCE
             - 其他元素为欧几里得距离，保留两位小数
     
@@ -122,30 +65,20 @@ def cal_distance(position_data):
         >>> distances[0][1]  # 节点0到节点1的距离
         5.0
     """
-    distance_vec = []
+    position = np.asarray(position_data, dtype=np.float64)
     
-    for i in range(len(position_data)):
-        row_vec = []
-        for j in range(len(position_data)):
-            x = position_data[i]  # 起点坐标
-            y = position_data[j]  # 终点坐标
-            
-            if (i == j):
-                # 节点到自身的距离设为无限大
-                row_vec.append(INFINITY_DISTANCE)
-            else:
-                # 计算欧几里得距离: sqrt((x1-x2)^2 + (y1-y2)^2)
-                euclidean_dist = math.sqrt(
-                    math.pow(x[0] - y[0], 2) + math.pow(x[1] - y[1], 2)
-                )
-                row_vec.append(round(euclidean_dist, 2))
-        
-        distance_vec.append(row_vec)
+    # 利用广播一次性计算欧几里得距离: sqrt((x1-x2)^2 + (y1-y2)^2)
+    diff = position[:, None, :] - position[None, :, :]
+    distance_vec = np.round(np.sqrt((diff ** 2).sum(axis=-1)), 2)
+    
+    # 节点到自身的距离设为无限大
+    np.fill_diagonal(distance_vec, INFINITY_DISTANCE)
     
     return distance_vec
 
 def generate_period_v2(data_path, ins_type, version, instance_pos, target_num = 25, 
-                       drone_num = 30, period_list = [1,3,6,12,18,24], time_num = 12):
+                       drone_num = 30, period_list = [1,3,6,12,18,24], time_num = 12,
+                       seed = None):
     """
     生成周期性监控实例 - 版本2（推荐使用）
     
@@ -168,6 +101,7 @@ def generate_period_v2(data_path, ins_type, version, instance_pos, target_num =
         drone_num (int): 可用无人机数量，默认 30
         period_list (list): 可选的监控周期列表（时间单位），默认 [1,3,6,12,18,24]
         time_num (int): 规划时间范围（时间单位），默认 12
+        seed (int | np.random.Generator): 随机种子或随机数生成器，默认 None（不固定种子）
     
     Returns:
         str: 生成的实例文件名（不含路径），格式为 '{ins_type}N{target_num}D{drone_num}T{time_num}V{version}'
@@ -187,7 +121,7 @@ def generate_period_v2(data_path, ins_type, version, instance_pos, target_num =
         C1N10D20T12V1p
     
     Notes:
-        - Solomon 数据文件格式要求节点坐标用 6 个空格分隔
+        - Solomon 数据文件中节点数据以空白分隔，坐标位于第 2、3 列
         - 起点（节点0）的监控周期设置为无限大（不需要被监控）
         - 时间缩放因子根据 time_num 和预定义的 time_horizon 计算
         - 监控周期的分配考虑了节点到起点的时间约束
@@ -196,33 +130,11 @@ def generate_period_v2(data_path, ins_type, version, instance_pos, target_num =
     if not os.path.exists(data_path):
         raise FileNotFoundError(f"Solomon 数据文件不存在: {data_path}")
     
-    f = open(data_path)
-    txt = []
-    i = 0
-    for line in f:
-        i += 1
-        if (i <= 9):
-            # 跳过 Solomon 文件的前 9 行头信息
-            continue
-        txt.append(line.strip())
-    f.close()
-
     # ========== 2. 提取节点位置信息 ==========
-    position_data = []
-    target_start = 0  # 固定起点为第一个节点（索引0）
-    
-    for i in range(len(txt)):
-        if (i < target_start): 
-            continue
-        if (i - target_start > target_num):
-            # 提取 target_num+1 个节点（包括起点）
-            break
-        
-        # Solomon 格式：节点数据用 6 个空格分隔
-        # 格式：节点编号(6空格)X坐标(6空格)Y坐标(6空格)需求量...
-        ans = [int(j) for j in txt[i].split('      ')]
-        # 提取 X 和 Y 坐标（索引1和2）
-        position_data.append([ans[j] for j in range(1, 3)])       
+    # 跳过 Solomon 文件的前 9 行头信息，提取 target_num+1 个节点（包括起点）的坐标
+    # 格式：节点编号 X坐标 Y坐标 需求量 ...（空白分隔，X 和 Y 坐标为第1、2列）
+    position_data = np.loadtxt(data_path, skiprows=9, usecols=(1, 2),
+                               max_rows=target_num + 1, dtype=np.int32, ndmin=2)
 
     # ========== 3. 获取时间参数并计算缩放因子 ==========
     # 无人机单次飞行的续航时间（基于原始 Solomon 时间尺度）
@@ -242,38 +154,23 @@ def generate_period_v2(data_path, ins_type, version, instance_pos, target_num =
     # 计算节点间的欧几里得距离矩阵
     distance_data = cal_distance(position_data)
     
-    # 构建每个节点的完整数据
-    target_data = []
-    for i in range(len(distance_data)):
-        ans = [i]  # 节点ID
-        
-        # 将距离转换为时间（向上取整）并添加到各节点的时间
-        for j in range(len(distance_data[i])):
-            travel_time = math.ceil(distance_data[i][j] * multiplier)
-            ans.append(travel_time)
-        
-        # 监控开始时间（固定为0）
-        ans.append(0)
-        
-        # 分配监控周期
-        if i == 0:
-            # 起点（仓库）不需要被监控，周期设为无限大
-            ans.append(INFINITY_PERIOD)
-        else:
-            # 为目标点分配监控周期
-            # 周期必须大于从起点到该点的飞行时间（ans[1]是到起点的时间）
-            filtered_period_list = [p for p in new_period_list if p > ans[1]]
-            
-            if not filtered_period_list:
-                # 如果没有合适的周期，使用最大可用周期
-                filtered_period_list = [max(new_period_list)]
-            
-            ans.append(random.choice(filtered_period_list))
-        
-        target_data.append(ans)
+    # 将距离转换为时间（向上取整）
+    time_data = np.ceil(distance_data * multiplier).astype(np.int32)
+    
+    node_num = len(time_data)
+    
+    # 监控开始时间（固定为0）
+    start_times = np.zeros(node_num, dtype=np.int32)
+    
+    # 分配监控周期
+    # 周期必须大于从起点到该点的飞行时间（time_data[:, 0]是到起点的时间）
+    rng = np.random.default_rng(seed)
+    periods = assign_periods(time_data[:, 0], new_period_list, rng)
+    
+    # 起点（仓库）不需要被监控，周期设为无限大
+    periods[0] = INFINITY_PERIOD
 
     # ========== 5. 准备输出数据 ==========
-    node_num = len(target_data)
     # 基本数据：节点数, 目标数, 仓库ID, 无人机续航, 开始时间, 结束时间, 无人机数
     basic_data = [
         node_num, 
@@ -294,23 +191,27 @@ def generate_period_v2(data_path, ins_type, version, instance_pos, target_num =
     
     output_file = os.path.join(output_dir, f'{instance_name}.txt')
     
-    with open(output_file, 'w+') as f:
-        # 写入列标题
-        f.write('numNode\tnumCus\tID_Depot\tMile(min)\tBegin\tEnd\tnumUAV\n')
-        
-        # 写入基本数据行
-        for i in basic_data:
-            f.write(f'{i}\t')
-        f.write('\n')
-
-        # 写入节点数据标题
-        f.write('time_vec & deta1 & deta2:\n')
-        
-        # 写入每个节点的数据
-        for i in target_data:
-            for j in i:
-                f.write(f'{j}\t')
-            f.write('\n')
+    # 在内存中拼接完整的文件内容，最后一次性写入
+    buf = io.StringIO()
+    
+    # 写入列标题
+    buf.write('numNode\tnumCus\tID_Depot\tMile(min)\tBegin\tEnd\tnumUAV\n')
+    
+    # 写入基本数据行（每个值后跟制表符，与原有实例文件格式一致）
+    buf.write(('%d\t' * len(basic_data)) % tuple(basic_data) + '\n')
+    
+    # 写入节点数据标题
+    buf.write('time_vec & deta1 & deta2:\n')
+    
+    # 写入每个节点的数据：节点ID + 到各节点的时间 + 监控开始时间 + 监控周期
+    # （每个值后跟制表符，与原有实例文件格式一致）
+    node_data = np.column_stack([np.arange(node_num, dtype=np.int32), time_data, start_times, periods])
+    # 预先构建整行的格式串，每行只做一次格式化
+    row_fmt = '%d\t' * node_data.shape[1] + '\n'
+    buf.writelines(row_fmt % tuple(row) for row in node_data.tolist())
+    
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(buf.getvalue())
     
     print(f"✓ 已生成实例: {instance_name}")
     
@@ -318,7 +219,7 @@ def generate_period_v2(data_path, ins_type, version, instance_pos, target_num =
 
 def get_file_name(folder_path):
     """
-    获取指定文件夹中所有文件的文件名（不含扩展名）
+    获取指定文件夹中所有 .txt 文件的文件名（不含扩展名）
     
     注意：此函数当前未被使用，保留用于可能的工具用途。
     
@@ -333,15 +234,10 @@ def get_file_name(folder_path):
         >>> print(names)
         ['c101', 'c201', 'r102', ...]
     """
-    files = []
-    for root, dirs, files_ in os.walk(folder_path, topdown=False):
-        files = files_
-        break  # 只处理第一级目录
-
-    names = []
-    for file in files:
-        # 去除文件扩展名（最后4个字符，假设为 .txt）
-        names.append(f"{file[:-4]}")
+    # 只处理第一级目录中的 .txt 文件，并去除扩展名
+    with os.scandir(folder_path) as entries:
+        names = [entry.name[:-4] for entry in entries
+                 if entry.is_file() and entry.name.endswith('.txt')]
     
     return names
 
@@ -392,6 +288,7 @@ if __name__ == '__main__':
     drone_num = 100      # 无人机数量
     time_num = 18        # 规划时间范围
     version_range = range(30, 35)  # 生成版本 30p 到 34p
+    seed = None          # 随机种子（设为整数可复现生成结果，None 表示不固定）
     
     print("=" * 60)
     print("无人机持续监控实例生成器")
@@ -404,6 +301,9 @@ if __name__ == '__main__':
     print(f"  - 输出目录: {OUTPUT_DIR}")
     print("=" * 60)
     
+    # 所有实例共用同一个随机数生成器
+    rng = np.random.default_rng(seed)
+    
     # ========== 遍历各实例类型生成 ==========
     for key, val in instance_dict.items():
         # 可选：只生成特定类型的实例
@@ -429,10 +329,6 @@ if __name__ == '__main__':
             
             try:
                 # ========== 调用生成函数 ==========
-                # 旧版本（已废弃）：
-                # new_instance = generate_period_v1(data_path, key, version, 30, period_list)
-                
-                # 推荐版本：
                 new_instance = generate_period_v2(
                     data_path=data_path,
                     ins_type=key,
@@ -441,7 +337,8 @@ if __name__ == '__main__':
                     target_num=target_num,
                     drone_num=drone_num,
                     period_list=period_list,
-                    time_num=time_num
+                    time_num=time_num,
+                    seed=rng
                 )
                 instance_list.append(new_instance)
                 